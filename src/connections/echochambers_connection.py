@@ -9,6 +9,9 @@ from src.connections.base_connection import BaseConnection, Action, ActionParame
 
 logger = logging.getLogger("connections.echochambers_connection")
 
+# Settings the connection cannot work without
+_REQUIRED_SETTINGS = ("api_url", "api_key", "room", "sender_username", "sender_model")
+
 class EchochambersConnectionError(Exception):
     """Base exception for Echochambers connection errors"""
     pass
@@ -35,9 +38,9 @@ class EchochambersConnection(BaseConnection):
         self.post_history_track = config.get("post_history_track")
 
         # Validate essential configurations
-        if not all([self.api_url, self.api_key, self.room, self.sender_username, self.sender_model, self.history_read_count, self.post_history_track]):
-            missing = [k for k in ["api_url", "api_key", "room", "sender_username", "sender_model", "history_read_count", "post_history_track"]
-                       if not getattr(self, k)]
+        missing = [k for k in (*_REQUIRED_SETTINGS, "history_read_count", "post_history_track")
+                   if not getattr(self, k)]
+        if missing:
             raise EchochambersConfigurationError(f"Missing configuration fields: {', '.join(missing)}")
 
         logger.info(f"✨ Connected to: {self.api_url}")
@@ -267,10 +270,10 @@ class EchochambersConnection(BaseConnection):
 
     def is_configured(self, verbose: bool = False) -> bool:
         """Check if the connection is properly configured"""
-        essentials = [self.api_url, self.api_key, self.room, self.sender_username, self.sender_model]
-        if not all(essentials):
+        missing = [k for k in _REQUIRED_SETTINGS if not getattr(self, k)]
+        if missing:
             if verbose:
-                logger.info("Echochambers connection is not configured")
+                logger.info(f"Echochambers connection is not configured, missing: {', '.join(missing)}")
             return False
 
         try:
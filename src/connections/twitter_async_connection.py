@@ -0,0 +1,167 @@
+import asyncio
+import logging
+from typing import Dict, Any, List
+from urllib.parse import urlencode
+import httpx
+from src.connections.twitter_connection import (
+    TwitterConnection, TwitterAPIError, RateLimiter, USERS_LOOKUP_BATCH_SIZE, json_loads,
+    _URL_USERS_BY, _URL_TWEETS
+)
+
+logger = logging.getLogger("connections.twitter_async_connection")
+
+# HTTP/2 multiplexes concurrent requests over a handful of connections
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 8
+MAX_ATTEMPTS = 3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+class AsyncTwitterConnection(TwitterConnection):
+    """Twitter connection that fans read requests out concurrently over HTTP/2"""
+
+    def _signed_headers(self, url: str, method: str, params: Dict[str, str] = None) -> Dict[str, str]:
+        """Build the OAuth1 Authorization header for a request"""
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        _, signer = self._get_oauth()
+        _, headers, _ = signer.sign(url, http_method=method)
+        return headers
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create an HTTP/2 client sized for large concurrent fan-outs"""
+        limits = httpx.Limits(max_connections=MAX_CONNECTIONS,
+                              max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS)
+        return httpx.AsyncClient(http2=True,
+                                 limits=limits,
+                                 timeout=httpx.Timeout(30.0, connect=3.05))
+
+    async def _request_async(self,
+                             client: httpx.AsyncClient,
+                             method: str,
+                             url_template: str,
+                             *url_args: str,
+                             params: Dict[str, Any] = None) -> dict:
+        """Make a signed request with exponential-backoff retries"""
+        url = url_template.format(*url_args) if url_args else url_template
+        params = {key: str(value) for key, value in (params or {}).items()}
+        rate_limit_key = RateLimiter.endpoint_key(method, url_template)
+
+        for attempt in range(MAX_ATTEMPTS):
+            wait = self._rate_limiter.reserve(rate_limit_key)
+            if wait > 0:
+                logger.warning(f"Rate limit reached for {rate_limit_key}, waiting {wait:.0f}s")
+                await asyncio.sleep(wait)
+
+            # Sign every attempt so each one carries a fresh nonce and timestamp
+            headers = self._signed_headers(url, method, params)
+            try:
+                response = await client.request(method, url, params=params, headers=headers)
+                self._rate_limiter.update(rate_limit_key, response.headers)
+                if response.status_code in RETRY_STATUSES and attempt < MAX_ATTEMPTS - 1:
+                    logger.warning(f"Request to {url} returned {response.status_code}, retrying")
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+                    continue
+
+                if response.status_code not in [200, 201]:
+                    logger.error(f"Request failed: {response.status_code} - {response.text}")
+                    raise TwitterAPIError(
+                        f"Request failed with status {response.status_code}: {response.text}",
+                        response.status_code)
+
+                return json_loads(response.content)
+
+            except httpx.TransportError as e:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise TwitterAPIError(f"API request failed: {str(e)}")
+                logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
+                await asyncio.sleep(0.5 * 2 ** attempt)
+
+    async def _get_user_ids_async(self,
+                                  client: httpx.AsyncClient,
+                                  usernames: List[str]) -> Dict[str, str]:
+        """Resolve usernames to user IDs, looking up unknown ones in concurrent batches of 100"""
+        unknown = list(dict.fromkeys(
+            username.lower() for username in usernames
+            if username.lower() not in self._user_ids))
+
+        responses = await asyncio.gather(*(
+            self._request_async(client,
+                                'GET',
+                                _URL_USERS_BY,
+                                params={'usernames': ','.join(unknown[i:i + USERS_LOOKUP_BATCH_SIZE])})
+            for i in range(0, len(unknown), USERS_LOOKUP_BATCH_SIZE)
+        ))
+        for response in responses:
+            self._cache_user_ids(response.get('data', []))
+
+        return {
+            username: self._user_ids[username.lower()]
+            for username in usernames if username.lower() in self._user_ids
+        }
+
+    async def _fetch_latest_tweets(self,
+                                   client: httpx.AsyncClient,
+                                   user_id: str,
+                                   count: int,
+                                   username: str = None) -> List[dict]:
+        """Get latest tweets for a user ID, evicting its cached username on 404"""
+        try:
+            response = await self._request_async(client,
+                                                 'GET',
+                                                 _URL_TWEETS,
+                                                 user_id,
+                                                 params=self._latest_tweets_params(count))
+        except TwitterAPIError as e:
+            if username is not None and e.status_code == 404:
+                self._forget_user_id(username)
+            raise
+        return response.get("data", [])
+
+    async def get_latest_tweets_bulk(self, usernames: List[str], count: int = 10) -> Dict[str, List[dict]]:
+        """Get latest tweets for several users concurrently, keyed by username
+
+        Users that are not found or whose fetch fails get an empty list and a warning.
+        """
+        logger.debug(f"Getting latest tweets for {len(usernames)} users, count: {count}")
+        async with self._create_client() as client:
+            user_ids = await self._get_user_ids_async(client, usernames)
+            # Lookups are case-insensitive, so fetch each resolved ID once
+            usernames_by_id: Dict[str, List[str]] = {}
+            for username in usernames:
+                if username in user_ids:
+                    usernames_by_id.setdefault(user_ids[username], []).append(username)
+            results = await asyncio.gather(*(
+                self._fetch_latest_tweets(client, user_id, count, names[0])
+                for user_id, names in usernames_by_id.items()
+            ), return_exceptions=True)
+
+        not_found = [username for username in usernames if username not in user_ids]
+        if not_found:
+            logger.warning(f"Users not found: {', '.join(not_found)}")
+
+        tweets = {}
+        for names, result in zip(usernames_by_id.values(), results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning(f"Failed to get latest tweets for {', '.join(names)}: {result}")
+                result = []
+            for username in names:
+                tweets[username] = result
+
+        logger.debug(f"Retrieved {sum(len(result) for result in results if isinstance(result, list))} tweets")
+        return {username: tweets.get(username, []) for username in usernames}
+
+    async def get_latest_tweets_async(self,
+                                      username: str,
+                                      count: int = 10,
+                                      user_id: str = None) -> list:
+        """Get latest tweets for a user from async code, get_latest_tweets stays sync"""
+        async with self._create_client() as client:
+            if user_id is not None:
+                return await self._fetch_latest_tweets(client, user_id, count)
+
+            user_ids = await self._get_user_ids_async(client, [username])
+            if username not in user_ids:
+                raise TwitterAPIError(f"User not found: {username}")
+            return await self._fetch_latest_tweets(client, user_ids[username], count, username)
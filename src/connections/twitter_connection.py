@@ -1,14 +1,73 @@
 import os
+import re
+import sys
+import json
+import time
 import logging
+import stat
+import tempfile
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, Any, List, Tuple
+from urllib.parse import urlencode
+import requests
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth1Session
-from dotenv import set_key, load_dotenv
-import tweepy
+from oauthlib.oauth1 import Client
+from dotenv import load_dotenv
+from dotenv.parser import parse_stream
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
 from src.helpers import print_h_bar
 
 logger = logging.getLogger("connections.twitter_connection")
 
+# API v2 endpoint URLs, "{}" placeholders are filled with str.format
+_API = sys.intern("https://api.twitter.com/2")
+_URL_USERS_ME = _API + "/users/me"
+_URL_USERS_BY = _API + "/users/by"
+_URL_TWEETS = _API + "/users/{}/tweets"
+_URL_TIMELINE = _API + "/users/{}/timelines/reverse_chronological"
+_URL_LIKES = _API + "/users/{}/likes"
+_URL_POST_TWEET = _API + "/tweets"
+_URL_SEARCH_RECENT = _API + "/tweets/search/recent"
+# Environment variables holding the Twitter credentials, with their descriptions
+_REQUIRED_CREDENTIALS = (
+    ('TWITTER_CONSUMER_KEY', 'consumer key'),
+    ('TWITTER_CONSUMER_SECRET', 'consumer secret'),
+    ('TWITTER_ACCESS_TOKEN', 'access token'),
+    ('TWITTER_ACCESS_TOKEN_SECRET', 'access token secret'),
+    ('TWITTER_USER_ID', 'user ID'),
+)
+# (connect, read) timeouts applied to every Twitter API request
+_REQUEST_TIMEOUT = (3.05, 30)
+# GET retries on 5xx and connection errors, 429s are left to RateLimiter
+_GET_MAX_ATTEMPTS = 6
+_RETRY_STATUSES = (500, 502, 503, 504)
+# Maximum number of usernames accepted by a single users/by lookup
+USERS_LOOKUP_BATCH_SIZE = 100
+# Username -> user ID cache shared across runs, user IDs never change
+USER_ID_CACHE_PATH = os.path.expanduser("~/.cache/minoai/twitter_users.json")
+# Seconds a successful credential check is trusted before calling users/me again
+CONFIGURED_CHECK_TTL = 300
+# Weighted length limit for tweet text
+MAX_TWEET_LENGTH = 280
+# Emoji presentation modifiers (variation selectors, skin tones, tag characters) that
+# Twitter folds into the emoji they follow, so they add no weight of their own
+_EMOJI_MODIFIERS = r"\uFE00-\uFE0F\U0001F3FB-\U0001F3FF\U000E0020-\U000E007F"
+_ZERO_WEIGHT_RE = re.compile(f"[{_EMOJI_MODIFIERS}]")
+# Code points Twitter's weighting counts as two characters (CJK, emoji, ...), everything
+# outside the Latin/general punctuation ranges of its text config
+_HEAVY_CHARS_RE = re.compile(
+    rf"[^\u0000-\u10FF\u2000-\u200D\u2010-\u201F\u2032-\u2037{_EMOJI_MODIFIERS}]")
+# Author info used for timeline tweets whose author is missing from the expansions
+_UNKNOWN_AUTHOR = {'name': "Unknown", 'username': "Unknown"}
+
 class TwitterConnectionError(Exception):
     """Base exception for Twitter connection errors"""
     pass
@@ -19,12 +78,148 @@ class TwitterConfigurationError(TwitterConnectionError):
 
 class TwitterAPIError(TwitterConnectionError):
     """Raised when Twitter API requests fail"""
-    pass
+    def __init__(self, message: str, status_code: int = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+class RateLimiter:
+    """Client-side limiter driven by Twitter's x-rate-limit-* response headers"""
+
+    def __init__(self):
+        # endpoint key -> (requests remaining, window reset as epoch seconds)
+        self._windows: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_key(method: str, url_template: str) -> str:
+        """Key an endpoint by method and URL template, limits are per endpoint not per ID"""
+        return f"{method.upper()} {url_template}"
+
+    def reserve(self, endpoint: str) -> float:
+        """Take one request from the endpoint's window, returning seconds to wait first"""
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None:
+                return 0.0
+
+            remaining, reset_at = window
+            now = time.time()
+            if reset_at <= now:
+                del self._windows[endpoint]
+                return 0.0
+            if remaining > 0:
+                self._windows[endpoint] = (remaining - 1, reset_at)
+                return 0.0
+            return reset_at - now
+
+    def acquire(self, endpoint: str) -> None:
+        """Block until the endpoint has requests left in its window"""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            logger.warning(f"Rate limit reached for {endpoint}, waiting {wait:.0f}s")
+            time.sleep(wait)
+
+    def update(self, endpoint: str, headers) -> None:
+        """Record the window reported by a response's rate limit headers"""
+        remaining = headers.get('x-rate-limit-remaining')
+        reset_at = headers.get('x-rate-limit-reset')
+        if remaining is None or reset_at is None:
+            return
+        with self._lock:
+            self._windows[endpoint] = (int(remaining), float(reset_at))
+
+@dataclass(frozen=True, slots=True)
+class _Credentials:
+    """Twitter credentials loaded from the environment"""
+    consumer_key: str
+    consumer_secret: str
+    access_token: str
+    access_token_secret: str
+    user_id: str
+
+@dataclass(slots=True)
+class Tweet:
+    """Timeline tweet whose author fields are resolved from the expanded users on access"""
+    id: str
+    text: str
+    author_id: str
+    created_at: str = None
+    attachments: Dict[str, Any] = None
+    _users: Dict[str, dict] = field(default_factory=dict, repr=False)
+
+    @property
+    def author_name(self) -> str:
+        return self._users.get(self.author_id, _UNKNOWN_AUTHOR)['name']
+
+    @property
+    def author_username(self) -> str:
+        return self._users.get(self.author_id, _UNKNOWN_AUTHOR)['username']
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access for callers that also handle raw API tweet dicts"""
+        value = getattr(self, key, None) if not key.startswith('_') else None
+        return default if value is None else value
 
 class TwitterConnection(BaseConnection):
+    # Built once at class load and shared by every instance
+    _ACTION_SCHEMA: Dict[str, Action] = {
+        "get-latest-tweets": Action(
+            name="get-latest-tweets",
+            parameters=[
+                ActionParameter("username", True, str, "Twitter username to get tweets from"),
+                ActionParameter("count", True, int, "Number of tweets to retrieve"),
+                ActionParameter("user_id", False, str, "User ID, skips the username lookup when known")
+            ],
+            description="Get the latest tweets from a user"
+        ),
+        "post-tweet": Action(
+            name="post-tweet",
+            parameters=[
+                ActionParameter("message", True, str, "Text content of the tweet")
+            ],
+            description="Post a new tweet"
+        ),
+        "read-timeline": Action(
+            name="read-timeline",
+            parameters=[
+                ActionParameter("count", False, int, "Number of tweets to read from timeline")
+            ],
+            description="Read tweets from user's timeline"
+        ),
+        "like-tweet": Action(
+            name="like-tweet",
+            parameters=[
+                ActionParameter("tweet_id", True, str, "ID of the tweet to like")
+            ],
+            description="Like a specific tweet"
+        ),
+        "reply-to-tweet": Action(
+            name="reply-to-tweet",
+            parameters=[
+                ActionParameter("tweet_id", True, str, "ID of the tweet to reply to"),
+                ActionParameter("message", True, str, "Reply message content")
+            ],
+            description="Reply to an existing tweet"
+        ),
+        "get-tweet-replies": Action(
+            name="get-tweet-replies",
+            parameters=[
+                ActionParameter("tweet_id", True, str, "ID of the tweet to query for replies")
+            ],
+            description="Fetch tweet replies"
+        )
+    }
+    # Action name -> name of the method implementing it
+    _ACTION_METHODS: Dict[str, str] = {name: name.replace('-', '_') for name in _ACTION_SCHEMA}
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self._oauth_session = None
+        self._session: requests.Session = None
+        self._oauth_client: Client = None
+        self._rate_limiter = RateLimiter()
+        self._configured_at: float = None
+        # User ID -> newest timeline tweet ID already returned
+        self._last_tweet_id: Dict[str, str] = {}
 
     @property
     def is_llm_provider(self) -> bool:
@@ -48,74 +243,16 @@ class TwitterConnection(BaseConnection):
 
     def register_actions(self) -> None:
         """Register available Twitter actions"""
-        self.actions = {
-            "get-latest-tweets": Action(
-                name="get-latest-tweets",
-                parameters=[
-                    ActionParameter("username", True, str, "Twitter username to get tweets from"),
-                    ActionParameter("count", True, int, "Number of tweets to retrieve")
-                ],
-                description="Get the latest tweets from a user"
-            ),
-            "post-tweet": Action(
-                name="post-tweet",
-                parameters=[
-                    ActionParameter("message", True, str, "Text content of the tweet")
-                ],
-                description="Post a new tweet"
-            ),
-            "read-timeline": Action(
-                name="read-timeline",
-                parameters=[
-                    ActionParameter("count", False, int, "Number of tweets to read from timeline")
-                ],
-                description="Read tweets from user's timeline"
-            ),
-            "like-tweet": Action(
-                name="like-tweet",
-                parameters=[
-                    ActionParameter("tweet_id", True, str, "ID of the tweet to like")
-                ],
-                description="Like a specific tweet"
-            ),
-            "reply-to-tweet": Action(
-                name="reply-to-tweet",
-                parameters=[
-                    ActionParameter("tweet_id", True, str, "ID of the tweet to reply to"),
-                    ActionParameter("message", True, str, "Reply message content")
-                ],
-                description="Reply to an existing tweet"
-            ),
-            "get-tweet-replies": Action(
-                name="get-tweet-replies",
-                parameters=[
-                    ActionParameter("tweet_id", True, str, "ID of the tweet to query for replies")
-                ],
-                description="Fetch tweet replies"
-            )
-        }
+        self.actions = self._ACTION_SCHEMA
 
     def _get_credentials(self) -> Dict[str, str]:
         """Get Twitter credentials from environment with validation"""
         logger.debug("Retrieving Twitter credentials")
         load_dotenv()
 
-        required_vars = {
-            'TWITTER_CONSUMER_KEY': 'consumer key',
-            'TWITTER_CONSUMER_SECRET': 'consumer secret',
-            'TWITTER_ACCESS_TOKEN': 'access token',
-            'TWITTER_ACCESS_TOKEN_SECRET': 'access token secret',
-            'TWITTER_USER_ID': 'user ID'
-        }
-
-        credentials = {}
-        missing = []
-
-        for env_var, description in required_vars.items():
-            value = os.getenv(env_var)
-            if not value:
-                missing.append(description)
-            credentials[env_var] = value
+        credentials = {env_var: os.environ.get(env_var) for env_var, _ in _REQUIRED_CREDENTIALS}
+        missing = [description for env_var, description in _REQUIRED_CREDENTIALS
+                   if not credentials[env_var]]
 
         if missing:
             error_msg = f"Missing Twitter credentials: {', '.join(missing)}"
@@ -123,66 +260,136 @@ class TwitterConnection(BaseConnection):
 
         logger.debug("All required credentials found")
         return credentials
+
+    @cached_property
+    def _creds(self) -> _Credentials:
+        """Credentials read once from .env and reused for every request"""
+        credentials = self._get_credentials()
+        return _Credentials(
+            consumer_key=credentials['TWITTER_CONSUMER_KEY'],
+            consumer_secret=credentials['TWITTER_CONSUMER_SECRET'],
+            access_token=credentials['TWITTER_ACCESS_TOKEN'],
+            access_token_secret=credentials['TWITTER_ACCESS_TOKEN_SECRET'],
+            user_id=credentials['TWITTER_USER_ID'])
      
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> dict:
+    def _make_request(self, method: str, url: str, *url_args: str,
+                      rate_limited: bool = True, **kwargs) -> dict:
         """
         Make a request to the Twitter API with error handling
 
         Args:
             method: HTTP method ('get', 'post', etc.)
-            endpoint: API endpoint path
+            url: API endpoint URL, one of the module's _URL_* templates
+            *url_args: Values for the URL template's placeholders
+            rate_limited: Wait for the endpoint's rate limit window before sending
             **kwargs: Additional request parameters
 
         Returns:
             Dict containing the API response
         """
-        logger.debug(f"Making {method.upper()} request to {endpoint}")
+        full_url = url.format(*url_args) if url_args else url
+        logger.debug(f"Making {method.upper()} request to {full_url}")
         try:
-            oauth = self._get_oauth()
-            full_url = f"https://api.twitter.com/2/{endpoint.lstrip('/')}"
+            rate_limit_key = RateLimiter.endpoint_key(method, url)
+            if rate_limited:
+                self._rate_limiter.acquire(rate_limit_key)
 
-            response = getattr(oauth, method.lower())(full_url, **kwargs)
+            kwargs.setdefault('timeout', _REQUEST_TIMEOUT)
+            response = self._signed_request(method, full_url, **kwargs)
+            # Record the window on every response, 429s included, so the next acquire() waits
+            self._rate_limiter.update(rate_limit_key, response.headers)
 
             if response.status_code not in [200, 201]:
                 logger.error(
                     f"Request failed: {response.status_code} - {response.text}"
                 )
                 raise TwitterAPIError(
-                    f"Request failed with status {response.status_code}: {response.text}"
+                    f"Request failed with status {response.status_code}: {response.text}",
+                    response.status_code
                 )
 
             logger.debug(f"Request successful: {response.status_code}")
-            return response.json()
+            return json_loads(response.content)
 
         except Exception as e:
-            raise TwitterAPIError(f"API request failed: {str(e)}")
+            raise TwitterAPIError(f"API request failed: {str(e)}",
+                                  getattr(e, 'status_code', None))
 
-    def _get_oauth(self) -> OAuth1Session:
-        """Get or create OAuth session using stored credentials"""
-        if self._oauth_session is None:
-            logger.debug("Creating new OAuth session")
+    def _get_oauth(self) -> Tuple[requests.Session, Client]:
+        """Get or create the pooled HTTP session and OAuth1 signer using stored credentials"""
+        if self._oauth_client is None:
+            logger.debug("Creating new OAuth signer")
             try:
-                credentials = self._get_credentials()
-                self._oauth_session = OAuth1Session(
-                    credentials['TWITTER_CONSUMER_KEY'],
-                    client_secret=credentials['TWITTER_CONSUMER_SECRET'],
-                    resource_owner_key=credentials['TWITTER_ACCESS_TOKEN'],
-                    resource_owner_secret=credentials[
-                        'TWITTER_ACCESS_TOKEN_SECRET'],
+                credentials = self._creds
+                self._oauth_client = Client(
+                    credentials.consumer_key,
+                    client_secret=credentials.consumer_secret,
+                    resource_owner_key=credentials.access_token,
+                    resource_owner_secret=credentials.access_token_secret,
                 )
-                logger.debug("OAuth session created successfully")
+                logger.debug("OAuth signer created successfully")
             except Exception as e:
-                logger.error(f"Failed to create OAuth session: {str(e)}")
+                logger.error(f"Failed to create OAuth signer: {str(e)}")
                 raise
 
-        return self._oauth_session
+        return self._get_session(), self._oauth_client
+
+    def _get_session(self) -> requests.Session:
+        """Get or create the pooled HTTP session"""
+        if self._session is None:
+            self._session = requests.Session()
+            self._mount_adapter(self._session)
+        return self._session
+
+    def _share_pool(self, session: requests.Session) -> None:
+        """Route another session's requests through the pooled session's connections"""
+        session.mount("https://", self._get_session().get_adapter("https://"))
+
+    def _signed_request(self,
+                        method: str,
+                        url: str,
+                        params: Dict[str, Any] = None,
+                        **kwargs) -> requests.Response:
+        """Sign a request with the shared OAuth1 signer and send it on the pooled session,
+        retrying GETs on server and connection errors"""
+        session, client = self._get_oauth()
+        method = method.upper()
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        attempts = _GET_MAX_ATTEMPTS if method == 'GET' else 1
+
+        for attempt in range(attempts):
+            # Sign every attempt so each one carries a fresh nonce and timestamp
+            signed_url, headers, _ = client.sign(url, http_method=method)
+            try:
+                response = session.request(method, signed_url, headers=headers, **kwargs)
+            except requests.ConnectionError as e:
+                if attempt == attempts - 1:
+                    raise
+                logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
+            else:
+                if response.status_code not in _RETRY_STATUSES or attempt == attempts - 1:
+                    return response
+                logger.warning(f"Request to {url} returned {response.status_code}, retrying")
+            time.sleep(0.5 * 2 ** attempt)
+
+    @staticmethod
+    def _mount_adapter(session: requests.Session) -> None:
+        """Mount a pooled adapter so connections are kept alive across calls"""
+        # No transport retries, a resent request would reuse the signed nonce, so
+        # _signed_request retries and re-signs instead
+        adapter = HTTPAdapter(pool_connections=4,
+                              pool_maxsize=16,
+                              max_retries=0)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
 
     def _get_authenticated_user_info(self) -> Tuple[str, str]:
         """Get the authenticated user's ID and username using the users/me endpoint"""
         logger.debug("Getting authenticated user info")
         try:
             response = self._make_request('get',
-                                        'users/me',
+                                        _URL_USERS_ME,
                                         params={'user.fields': 'id,username'})
             user_id = response['data']['id']
             username = response['data']['username']
@@ -200,12 +407,19 @@ class TwitterConnection(BaseConnection):
             error_msg = f"{context} text cannot be empty"
             logger.error(error_msg)
             raise ValueError(error_msg)
-        if len(text) > 280:
-            error_msg = f"{context} exceeds 280 character limit"
+        if self._weighted_length(text) > MAX_TWEET_LENGTH:
+            error_msg = f"{context} exceeds {MAX_TWEET_LENGTH} character limit"
             logger.error(error_msg)
             raise ValueError(error_msg)
         logger.debug(f"Tweet text validation passed for {context.lower()}")
 
+    @staticmethod
+    def _weighted_length(text: str) -> int:
+        """Length of text as Twitter counts it, after NFC normalization"""
+        text = unicodedata.normalize('NFC', text)
+        return (len(text) + len(_HEAVY_CHARS_RE.findall(text))
+                - len(_ZERO_WEIGHT_RE.findall(text)))
+
     def configure(self) -> None:
         """Sets up Twitter API authentication"""
         logger.info("Starting Twitter authentication setup")
@@ -244,6 +458,7 @@ class TwitterConnection(BaseConnection):
             request_token_url = "https://api.twitter.com/oauth/request_token?oauth_callback=oob&x_auth_access_type=write"
             oauth = OAuth1Session(credentials['consumer_key'],
                                   client_secret=credentials['consumer_secret'])
+            self._share_pool(oauth)
 
             try:
                 fetch_response = oauth.fetch_request_token(request_token_url)
@@ -273,23 +488,16 @@ class TwitterConnection(BaseConnection):
                 resource_owner_key=fetch_response.get('oauth_token'),
                 resource_owner_secret=fetch_response.get('oauth_token_secret'),
                 verifier=verifier)
+            self._share_pool(oauth)
 
             oauth_tokens = oauth.fetch_access_token(access_token_url)
 
-            # Save credentials
-            if not os.path.exists('.env'):
-                logger.debug("Creating new .env file")
-                with open('.env', 'w') as f:
-                    f.write('')
-
-            # Create temporary OAuth session to get user ID
-            temp_oauth = OAuth1Session(
+            # Sign with the new tokens to get user ID
+            self._oauth_client = Client(
                 credentials['consumer_key'],
                 client_secret=credentials['consumer_secret'],
                 resource_owner_key=oauth_tokens.get('oauth_token'),
                 resource_owner_secret=oauth_tokens.get('oauth_token_secret'))
-
-            self._oauth_session = temp_oauth
             user_id, username = self._get_authenticated_user_info()
 
             # Save to .env
@@ -308,9 +516,12 @@ class TwitterConnection(BaseConnection):
                 oauth_tokens.get('oauth_token_secret')
             }
 
-            for key, value in env_vars.items():
-                set_key('.env', key, value)
-                logger.debug(f"Saved {key} to .env")
+            self._batch_set_env(env_vars)
+
+            # Make the new credentials visible to the next _creds lookup
+            os.environ.update(env_vars)
+            self.__dict__.pop('_creds', None)
+            self._configured_at = None
 
             logger.info("\n✅ Twitter authentication successfully set up!")
             logger.info(
@@ -323,24 +534,74 @@ class TwitterConnection(BaseConnection):
             logger.error(error_msg)
             raise TwitterConfigurationError(error_msg)
 
+    def _batch_set_env(self, pairs: Dict[str, str]) -> None:
+        """Set several .env keys with a single durable rewrite, keeping unrelated lines"""
+        pending = {
+            key: "{}='{}'\n".format(key, value.replace("'", "\\'"))
+            for key, value in pairs.items()
+        }
+
+        env_path = os.path.abspath('.env')
+        env_dir = os.path.dirname(env_path)
+        lines = []
+        seen = set()
+        # Keep the existing file's permissions, new files hold secrets so start private
+        mode = 0o600
+        if os.path.exists(env_path):
+            mode = stat.S_IMODE(os.stat(env_path).st_mode)
+            with open(env_path, encoding="utf-8") as f:
+                for binding in parse_stream(f):
+                    # Rewrite every occurrence, dotenv loads the last one
+                    if binding.key in pending:
+                        lines.append(pending[binding.key])
+                        seen.add(binding.key)
+                    else:
+                        lines.append(binding.original.string)
+        if lines and not lines[-1].endswith('\n'):
+            lines.append('\n')
+        lines.extend(line for key, line in pending.items() if key not in seen)
+
+        fd, tmp_path = tempfile.mkstemp(dir=env_dir, prefix='.tmp_')
+        try:
+            os.chmod(tmp_path, mode)
+            with open(fd, 'w', encoding="utf-8") as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, env_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        # Persist the rename itself, not just the new file's contents
+        dir_fd = os.open(env_dir, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+        logger.debug(f"Saved {', '.join(pairs)} to .env")
+
     def is_configured(self, verbose = False) -> bool:
         """Check if Twitter credentials are configured and valid"""
         logger.debug("Checking Twitter configuration status")
-        try:
-            credentials = self._get_credentials()
-
-            # Initialize client and validate credentials
-            client = tweepy.Client(
-                consumer_key=credentials['TWITTER_CONSUMER_KEY'],
-                consumer_secret=credentials['TWITTER_CONSUMER_SECRET'],
-                access_token=credentials['TWITTER_ACCESS_TOKEN'],
-                access_token_secret=credentials['TWITTER_ACCESS_TOKEN_SECRET'])
+        if (self._configured_at is not None
+                and time.monotonic() - self._configured_at < CONFIGURED_CHECK_TTL):
+            logger.debug("Twitter configuration was recently validated")
+            return True
 
-            client.get_me()
+        try:
+            # Load credentials first so missing ones surface as a configuration error
+            self._creds
+            # Validate credentials over the pooled session, failing fast rather than
+            # sleeping out an exhausted rate limit window
+            self._make_request('get', _URL_USERS_ME, rate_limited=False, timeout=(3.05, 10))
+            self._configured_at = time.monotonic()
             logger.debug("Twitter configuration is valid")
             return True
 
         except Exception as e:
+            self._configured_at = None
             if verbose:
                 error_msg = str(e)
                 if isinstance(e, TwitterConfigurationError):
@@ -352,10 +613,10 @@ class TwitterConnection(BaseConnection):
 
     def perform_action(self, action_name: str, kwargs) -> Any:
         """Execute a Twitter action with validation"""
-        if action_name not in self.actions:
+        action = self.actions.get(action_name)
+        if action is None:
             raise KeyError(f"Unknown action: {action_name}")
 
-        action = self.actions[action_name]
         errors = action.validate_params(kwargs)
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
@@ -365,84 +626,161 @@ class TwitterConnection(BaseConnection):
             kwargs["count"] = self.config["timeline_read_count"]
 
         # Call the appropriate method based on action name
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = getattr(self, self._ACTION_METHODS[action_name])
         return method(**kwargs)
 
-    def read_timeline(self, count: int = None, **kwargs) -> list:
-        """Read tweets from the user's timeline"""
+    def read_timeline(self, count: int = None, **kwargs) -> List[Tweet]:
+        """Read tweets from the user's timeline posted since the previous read"""
         if count is None:
             count = self.config["timeline_read_count"]
             
         logger.debug(f"Reading timeline, count: {count}")
-        credentials = self._get_credentials()
 
+        user_id = self._creds.user_id
         params = {
             "tweet.fields": "created_at,author_id,attachments",
             "expansions": "author_id",
             "user.fields": "name,username",
             "max_results": count
         }
+        if user_id in self._last_tweet_id:
+            params["since_id"] = self._last_tweet_id[user_id]
 
         response = self._make_request(
             'get',
-            f"users/{credentials['TWITTER_USER_ID']}/timelines/reverse_chronological",
+            _URL_TIMELINE,
+            user_id,
             params=params
         )
 
-        tweets = response.get("data", [])
+        data = response.get("data", [])
+        if data:
+            self._last_tweet_id[user_id] = max((tweet['id'] for tweet in data), key=int)
         user_info = response.get("includes", {}).get("users", [])
 
-        user_dict = {
-            user['id']: {
-                'name': user['name'],
-                'username': user['username']
-            }
-            for user in user_info
-        }
-
-        for tweet in tweets:
-            author_id = tweet['author_id']
-            author_info = user_dict.get(author_id, {
-                'name': "Unknown",
-                'username': "Unknown"
-            })
-            tweet.update({
-                'author_name': author_info['name'],
-                'author_username': author_info['username']
-            })
+        user_dict = {user['id']: user for user in user_info}
+        tweets = [
+            Tweet(tweet['id'], tweet['text'], tweet['author_id'],
+                  tweet.get('created_at'), tweet.get('attachments'), user_dict)
+            for tweet in data
+        ]
 
         logger.debug(f"Retrieved {len(tweets)} tweets")
         return tweets
 
+    def get_user_ids_from_usernames(self, usernames: List[str]) -> Dict[str, str]:
+        """Resolve usernames to user IDs, looking up unknown ones 100 at a time"""
+        unknown = list(dict.fromkeys(
+            username.lower() for username in usernames
+            if username.lower() not in self._user_ids))
+
+        for i in range(0, len(unknown), USERS_LOOKUP_BATCH_SIZE):
+            chunk = unknown[i:i + USERS_LOOKUP_BATCH_SIZE]
+            logger.debug(f"Looking up {len(chunk)} user IDs")
+            response = self._make_request('get',
+                                          _URL_USERS_BY,
+                                          params={'usernames': ','.join(chunk)})
+            self._cache_user_ids(response.get('data', []))
+
+        return {
+            username: self._user_ids[username.lower()]
+            for username in usernames if username.lower() in self._user_ids
+        }
+
+    def get_user_id_from_username(self, username: str) -> str:
+        """Resolve a single username to its user ID"""
+        user_ids = self.get_user_ids_from_usernames([username])
+        if username not in user_ids:
+            raise TwitterAPIError(f"User not found: {username}")
+        return user_ids[username]
+
+    @cached_property
+    def _user_ids(self) -> Dict[str, str]:
+        """Lowercased username -> user ID, loaded from the on-disk cache on first use"""
+        try:
+            with open(USER_ID_CACHE_PATH) as f:
+                user_ids = json.load(f)
+            logger.debug(f"Loaded {len(user_ids)} cached user IDs")
+            return user_ids
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable user ID cache: {str(e)}")
+            return {}
+
+    def _save_user_ids(self) -> None:
+        """Write the user ID cache back to disk"""
+        try:
+            cache_dir = os.path.dirname(USER_ID_CACHE_PATH)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Unique temp file so concurrent processes never write into the same one
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.tmp_')
+            try:
+                with open(fd, 'w', encoding="utf-8") as f:
+                    json.dump(self._user_ids, f)
+                os.replace(tmp_path, USER_ID_CACHE_PATH)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not save user ID cache: {str(e)}")
+
+    def _cache_user_ids(self, users: List[dict]) -> None:
+        """Remember the user IDs returned by a users/by lookup"""
+        if not users:
+            return
+        for user in users:
+            self._user_ids[user['username'].lower()] = user['id']
+        self._save_user_ids()
+
+    def _forget_user_id(self, username: str) -> None:
+        """Drop a cached user ID that Twitter no longer recognizes"""
+        if self._user_ids.pop(username.lower(), None) is not None:
+            logger.debug(f"Evicted cached user ID for {username}")
+            self._save_user_ids()
+
     def get_latest_tweets(self,
                           username: str,
                           count: int = 10,
+                          user_id: str = None,
                           **kwargs) -> list:
         """Get latest tweets for a user"""
         logger.debug(f"Getting latest tweets for {username}, count: {count}")
 
-        credentials = self._get_credentials()
-        params = {
-            "tweet.fields": "created_at,text",
-            "max_results": min(count, 100),
-            "exclude": "retweets,replies"
-        }
+        cached_lookup = user_id is None
+        if cached_lookup:
+            user_id = self.get_user_id_from_username(username)
+        params = self._latest_tweets_params(count)
 
-        response = self._make_request('get',
-                                      f"users/{credentials['TWITTER_USER_ID']}/tweets",
-                                      params=params)
+        try:
+            response = self._make_request('get',
+                                          _URL_TWEETS,
+                                          user_id,
+                                          params=params)
+        except TwitterAPIError as e:
+            if cached_lookup and e.status_code == 404:
+                self._forget_user_id(username)
+            raise
 
         tweets = response.get("data", [])
         logger.debug(f"Retrieved {len(tweets)} tweets")
         return tweets
 
+    @staticmethod
+    def _latest_tweets_params(count: int) -> Dict[str, Any]:
+        """Query parameters shared by every latest-tweets lookup"""
+        return {
+            "tweet.fields": "created_at,text",
+            "max_results": min(count, 100),
+            "exclude": "retweets,replies"
+        }
+
     def post_tweet(self, message: str, **kwargs) -> dict:
         """Post a new tweet"""
         logger.debug("Posting new tweet")
         self._validate_tweet_text(message)
 
-        response = self._make_request('post', 'tweets', json={'text': message})
+        response = self._make_request('post', _URL_POST_TWEET, json={'text': message})
 
         logger.info("Tweet posted successfully")
         return response
@@ -453,7 +791,7 @@ class TwitterConnection(BaseConnection):
         self._validate_tweet_text(message, "Reply")
 
         response = self._make_request('post',
-                                      'tweets',
+                                      _URL_POST_TWEET,
                                       json={
                                           'text': message,
                                           'reply': {
@@ -467,11 +805,11 @@ class TwitterConnection(BaseConnection):
     def like_tweet(self, tweet_id: str, **kwargs) -> dict:
         """Like a tweet"""
         logger.debug(f"Liking tweet {tweet_id}")
-        credentials = self._get_credentials()
 
         response = self._make_request(
             'post',
-            f"users/{credentials['TWITTER_USER_ID']}/likes",
+            _URL_LIKES,
+            self._creds.user_id,
             json={'tweet_id': tweet_id})
 
         logger.info("Tweet liked successfully")
@@ -487,7 +825,7 @@ class TwitterConnection(BaseConnection):
             "max_results": min(count, 100)
         }
         
-        response = self._make_request('get', 'tweets/search/recent', params=params)
+        response = self._make_request('get', _URL_SEARCH_RECENT, params=params)
         replies = response.get("data", [])
         
         logger.info(f"Retrieved {len(replies)} replies")